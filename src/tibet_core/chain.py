@@ -2,9 +2,11 @@
 TIBET Chain - Provenance chain utilities.
 """
 
-from typing import List, Optional, Dict, Any
+from collections import deque
+from itertools import islice
+from typing import Iterator, List, Optional, Dict, Any
 from .token import Token
-from .store import TokenStore
+from .store import _ROOT_SEED, _extend_root, TokenStore
 
 
 class Chain:
@@ -30,6 +32,10 @@ class Chain:
         """Initialize with token store."""
         self.store = store
 
+    def _trace_iter(self, token_id: str, max_depth: int = 100) -> Iterator[Token]:
+        """Yield the provenance chain newest to oldest, without building a list."""
+        return islice(self.store.walk_parents(token_id), max(0, max_depth))
+
     def trace(self, token_id: str, max_depth: int = 100) -> List[Token]:
         """
         Trace provenance chain backwards.
@@ -41,23 +47,7 @@ class Chain:
         Returns:
             List of tokens from newest to oldest
         """
-        chain = []
-        current_id = token_id
-        seen = set()
-
-        while current_id and len(chain) < max_depth:
-            if current_id in seen:
-                break  # Circular reference protection
-            seen.add(current_id)
-
-            token = self.store.get(current_id)
-            if token:
-                chain.append(token)
-                current_id = token.parent_id
-            else:
-                break
-
-        return chain
+        return list(self._trace_iter(token_id, max_depth))
 
     def verify(self, token_id: str) -> bool:
         """
@@ -69,8 +59,30 @@ class Chain:
         Returns:
             True if all tokens in chain have valid hashes
         """
-        chain = self.trace(token_id)
-        return all(t.verify() for t in chain)
+        return all(t.verify() for t in self._trace_iter(token_id))
+
+    def verify_against_root(self, root: str, key: Optional[bytes] = None) -> bool:
+        """
+        Audit the whole store against a previously recorded chain root.
+
+        Recomputes the rolling root once over every stored token while
+        rehashing each token (the verify() cache is bypassed). Comparing
+        store.chain_root() to a known root is the O(1) check; this is
+        the full re-walk for when tampering is suspected.
+
+        Args:
+            root: Hex root from Provider.chain_root / store.chain_root()
+            key: HMAC key the tokens were created with, if any
+
+        Returns:
+            True if every token verifies and the recomputed root matches
+        """
+        current = _ROOT_SEED
+        for token in self.store.all():
+            if not token._matches(key):
+                return False
+            current = _extend_root(current, token.content_hash)
+        return current.hex() == root
 
     def summary(self, token_id: str) -> Dict[str, Any]:
         """
@@ -82,32 +94,43 @@ class Chain:
         Returns:
             Summary dict with stats and actors
         """
-        chain = self.trace(token_id)
-
-        if not chain:
+        newest = oldest = None
+        actors = set()
+        actions = []
+        valid = True
+
+        for t in self._trace_iter(token_id):
+            if newest is None:
+                newest = t
+            oldest = t
+            actors.add(t.actor)
+            actions.append(t.action)
+            if valid and not t.verify():
+                valid = False
+
+        if newest is None:
             return {"length": 0, "valid": False}
 
-        actors = set(t.actor for t in chain)
-        actions = [t.action for t in chain]
-
         return {
-            "length": len(chain),
-            "valid": all(t.verify() for t in chain),
+            "length": len(actions),
+            "valid": valid,
             "actors": list(actors),
             "actions": actions,
-            "start": chain[-1].timestamp if chain else None,
-            "end": chain[0].timestamp if chain else None,
-            "root_id": chain[-1].token_id if chain else None,
+            "start": oldest.timestamp,
+            "end": newest.timestamp,
+            "root_id": oldest.token_id,
         }
 
     def find_root(self, token_id: str) -> Optional[Token]:
         """Find root token of chain."""
-        chain = self.trace(token_id)
-        return chain[-1] if chain else None
+        root = None
+        for root in self._trace_iter(token_id):
+            pass
+        return root
 
     def find_children(self, token_id: str) -> List[Token]:
         """Find all tokens that reference this token as parent."""
-        return [t for t in self.store.all() if t.parent_id == token_id]
+        return self.store.children(token_id)
 
     def tree(self, root_id: str, max_depth: int = 10) -> Dict[str, Any]:
         """
@@ -120,24 +143,35 @@ class Chain:
         Returns:
             Nested dict representing token tree
         """
-        def build_node(token_id: str, depth: int) -> Dict[str, Any]:
+        # Breadth-first with an explicit queue: each entry is the children
+        # list the node belongs in, so deep trees need no recursion.
+        get = self.store.get
+        children = self.store.children
+        top: List[Dict[str, Any]] = []
+        queue = deque([(top, root_id, 0)])
+
+        while queue:
+            siblings, token_id, depth = queue.popleft()
             if depth > max_depth:
-                return {"id": token_id, "truncated": True}
+                siblings.append({"id": token_id, "truncated": True})
+                continue
 
-            token = self.store.get(token_id)
+            token = get(token_id)
             if not token:
-                return {"id": token_id, "missing": True}
-
-            children = self.find_children(token_id)
+                siblings.append({"id": token_id, "missing": True})
+                continue
 
-            return {
+            node = {
                 "id": token.token_id,
                 "action": token.action,
                 "actor": token.actor,
                 "timestamp": token.timestamp,
                 "erachter": token.erachter,
                 "valid": token.verify(),
-                "children": [build_node(c.token_id, depth + 1) for c in children]
+                "children": [],
             }
+            siblings.append(node)
+            for child in children(token_id):
+                queue.append((node["children"], child.token_id, depth + 1))
 
-        return build_node(root_id, 0)
+        return top[0]
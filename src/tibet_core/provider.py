@@ -5,7 +5,7 @@ TIBET Provider - Factory for creating and managing tokens.
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
-from .token import Token, TokenState, create_token_id
+from .token import HASH_ALGO, HASH_ALGORITHMS, Token, TokenState, create_token_id
 from .store import MemoryStore, TokenStore
 
 
@@ -42,7 +42,8 @@ class Provider:
         store: Optional[TokenStore] = None,
         on_token: Optional[Callable[[Token], None]] = None,
         auto_chain: bool = True,
-        hmac_key: Optional[bytes] = None
+        hmac_key: Optional[bytes] = None,
+        hash_algo: str = HASH_ALGO
     ):
         """
         Initialize provider.
@@ -53,12 +54,17 @@ class Provider:
             on_token: Callback for each created token
             auto_chain: Automatically link sequential tokens
             hmac_key: Optional HMAC key for token integrity
+            hash_algo: Content hash algorithm ("sha256" or "blake2b")
         """
+        if hash_algo not in HASH_ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm: {hash_algo}")
+
         self.actor = actor
         self.store = store or MemoryStore()
         self.on_token = on_token
         self.auto_chain = auto_chain
         self.hmac_key = hmac_key
+        self.hash_algo = hash_algo
         self._last_token_id: Optional[str] = None
 
     def __enter__(self):
@@ -114,10 +120,10 @@ class Provider:
             state=state
         )
 
-        # If HMAC key set, recompute hash with key
-        if self.hmac_key:
-            hmac_hash = token._compute_hash(self.hmac_key)
-            object.__setattr__(token, "content_hash", hmac_hash)
+        # If HMAC key or another algorithm set, recompute hash with it
+        if self.hmac_key or self.hash_algo != HASH_ALGO:
+            content_hash = token._compute_hash(self.hmac_key, self.hash_algo)
+            object.__setattr__(token, "content_hash", content_hash)
 
         # Store token
         self.store.add(token)
@@ -331,7 +337,13 @@ class Provider:
             raise ValueError(f"Unknown format: {format}")
 
     def verify_all(self) -> Dict[str, bool]:
-        """Verify integrity of all tokens."""
+        """
+        Verify integrity of all tokens.
+
+        Runs in-process on purpose: pickling a token to a worker process
+        costs more than hashing it, so a process pool does not pay off.
+        Repeat calls are cheap because Token.verify() caches successes.
+        """
         key = self.hmac_key
         return {t.token_id: t.verify(key) for t in self.store.all()}
 
@@ -345,5 +357,10 @@ class Provider:
         """Number of stored tokens."""
         return self.store.count()
 
+    @property
+    def chain_root(self) -> str:
+        """Rolling root over all stored token hashes (see Chain.verify_against_root)."""
+        return self.store.chain_root()
+
     def __repr__(self) -> str:
         return f"Provider(actor={self.actor}, tokens={self.count})"
@@ -2,12 +2,20 @@
 TIBET Token Storage backends.
 """
 
+import hashlib
 import json
+import os
+import sys
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from array import array
+from bisect import bisect_left, insort
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
-from .token import Token
+from typing import Dict, Iterator, List, Optional, Tuple
+from .token import Token, TokenState
 
 # File locking: available on Unix, graceful fallback elsewhere
 try:
@@ -16,6 +24,193 @@ try:
 except ImportError:
     _HAS_FCNTL = False
 
+_HAS_PWRITE = hasattr(os, "pwrite")
+
+
+def _intern(value):
+    """sys.intern for exact str values, anything else unchanged."""
+    return sys.intern(value) if value.__class__ is str else value
+
+
+# Chain root of an empty store; each token extends it (see _extend_root)
+_ROOT_SEED = bytes(32)
+
+
+def _extend_root(root: bytes, content_hash: str) -> bytes:
+    """Rolling chain root: r_i = SHA-256(r_{i-1} || content_hash_i)."""
+    return hashlib.sha256(root + content_hash.encode()).digest()
+
+
+def _line_hash(line: bytes) -> str:
+    """content_hash of one JSONL line (computed if the line has none)."""
+    data = json.loads(line)
+    return data.get("content_hash") or Token.from_dict(data).content_hash
+
+
+class _RootSidecar:
+    """
+    The `<path>.root` file next to a FileStore: the hex chain root of the
+    file's lines, overwritten in place after each append.
+
+    The root is tracked for the file, not for one store's view: before
+    appending (under the file lock) any lines other writers added are
+    read back, folded in and checked against what they recorded.
+    """
+
+    def __init__(self, data_path: Path):
+        self.data_path = data_path
+        self.path = Path(f"{data_path}.root")
+        self.root = _ROOT_SEED      # root of the file's first `end` bytes
+        self.end = 0
+        self.pending: List[str] = []  # content hashes of buffered lines
+        # True: file matches the record; False: it does not; None: no
+        # record, or lines nobody recorded. hold stops further records.
+        self.ok: Optional[bool] = None
+        self.hold = False
+        self._fh = None
+
+    def read(self) -> Optional[bytes]:
+        """Recorded root, None without a sidecar (b"" if unreadable)."""
+        try:
+            text = self.path.read_bytes().strip()
+        except FileNotFoundError:
+            return None
+        try:
+            return bytes.fromhex(text.decode("ascii"))
+        except ValueError:
+            return b""
+
+    def start(self, root: bytes, end: int, stored: Optional[bytes], prefix: bool) -> None:
+        """Adopt the root of a freshly loaded file and compare it to the record."""
+        self.root, self.end = root, end
+        self.pending.clear()
+        if stored is None:
+            self.ok, self.hold = None, False
+        elif stored == root:
+            self.ok, self.hold = True, False
+        elif prefix:
+            # Recorded root covers only the first lines; the rest are unvouched
+            self.ok, self.hold = None, True
+        else:
+            self.ok, self.hold = False, True
+
+    def catch_up(self, size: int) -> None:
+        """Fold in lines other writers appended since our last write."""
+        if size == self.end:
+            return
+        if size > self.end:
+            with open(self.data_path, "rb") as f:
+                f.seek(self.end)
+                tail = f.read(size - self.end)
+            root = self.root
+            try:
+                for line in tail.split(b"\n"):
+                    if line.strip():
+                        root = _extend_root(root, _line_hash(line))
+            except (ValueError, TypeError, KeyError):
+                root = None
+            self.end = size
+            if root is not None:
+                self.root = root
+                if self.read() == root:
+                    return
+        else:
+            self.end = size
+        # Lines nobody recorded (or a file that shrank under us)
+        if self.ok is not False:
+            self.ok = None
+        self.hold = True
+
+    def record(self, size: int, fsync: bool) -> None:
+        """Account for `size` bytes of buffered lines just appended."""
+        root = self.root
+        for content_hash in self.pending:
+            root = _extend_root(root, content_hash)
+        self.pending.clear()
+        self.root = root
+        self.end += size
+        if not self.hold:
+            self._write(fsync)
+
+    def reset(self, root: bytes, end: int, fsync: bool) -> None:
+        """Record a rewritten file's root as the new commitment."""
+        self.root, self.end = root, end
+        self.pending.clear()
+        self.ok, self.hold = True, False
+        self._write(fsync)
+
+    def _write(self, fsync: bool) -> None:
+        data = self.root.hex().encode()
+        if self._fh is None:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o644)
+            self._fh = os.fdopen(fd, "wb", buffering=0)
+            self._fh.write(data)
+            self._fh.truncate(len(data))
+        elif _HAS_PWRITE:
+            os.pwrite(self._fh.fileno(), data, 0)
+        else:
+            self._fh.seek(0)
+            self._fh.write(data)
+        if fsync:
+            os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+@contextmanager
+def _file_lock(f):
+    """Exclusive flock on an open file where fcntl exists, no-op elsewhere."""
+    if not _HAS_FCNTL:
+        yield
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _write_lines(
+    f, lines: List[bytes], fsync: bool, sidecar: Optional[_RootSidecar] = None
+) -> None:
+    """Write buffered JSONL lines in one locked append, then empty the buffer."""
+    if not lines:
+        return
+    data = b"".join(lines)
+    lines.clear()
+    fd = f.fileno()
+    if _HAS_FCNTL:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        # The sidecar is updated under the same lock, after the lines, so a
+        # crash in between leaves a prefix root rather than a wrong one
+        if sidecar is not None:
+            sidecar.catch_up(os.fstat(fd).st_size)
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(fd)
+        if sidecar is not None:
+            sidecar.record(len(data), fsync)
+    finally:
+        if _HAS_FCNTL:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _close_append_handle(
+    f, lines: List[bytes], lock: threading.Lock, fsync: bool, sidecar: _RootSidecar
+) -> None:
+    """Flush what is left and close (runs on close(), GC or interpreter exit)."""
+    with lock:
+        try:
+            _write_lines(f, lines, fsync, sidecar)
+        finally:
+            f.close()
+            sidecar.close()
+
 
 class TokenStore(ABC):
     """Abstract base for token storage."""
@@ -46,6 +241,32 @@ class TokenStore(ABC):
         """Find tokens matching criteria."""
         pass
 
+    def children(self, parent_id: str) -> List[Token]:
+        """Get tokens whose parent_id is parent_id (override for O(1) lookup)."""
+        return [t for t in self.all() if t.parent_id == parent_id]
+
+    def walk_parents(self, token_id: str) -> Iterator[Token]:
+        """Yield the token, then its parent, and so on; stops at a cycle."""
+        current_id = token_id
+        # A plain set: str hashes are cached, so a membership test is a
+        # single C-level probe, cheaper than any Python-level bloom filter.
+        seen = set()
+
+        while current_id and current_id not in seen:
+            seen.add(current_id)
+            token = self.get(current_id)
+            if not token:
+                return
+            yield token
+            current_id = token.parent_id
+
+    def chain_root(self) -> str:
+        """Rolling root over every stored content_hash, in insertion order (hex)."""
+        root = _ROOT_SEED
+        for token in self.all():
+            root = _extend_root(root, token.content_hash)
+        return root.hex()
+
     @abstractmethod
     def count(self) -> int:
         """Count stored tokens."""
@@ -57,7 +278,137 @@ class TokenStore(ABC):
         pass
 
 
-class MemoryStore(TokenStore):
+class _IndexedStore(TokenStore):
+    """
+    Shared index bookkeeping for the list-backed stores.
+
+    Tokens live in an append-only list; the indexes hold list positions:
+    token_id -> position, action/actor/parent_id -> positions (ascending),
+    and (timestamp, position) pairs kept sorted for `since` queries.
+    Token id, action, actor and timestamp are also kept as parallel
+    columns so filters read flat lists instead of dereferencing every
+    Token, and _parent_idx holds each token's parent position (-1 if
+    absent) so chain walks follow integers instead of hashing ids. The
+    rolling chain root is extended as each token is indexed, so
+    chain_root() is O(1).
+    """
+
+    def _reset_indexes(self) -> None:
+        self._index: Dict[str, int] = {}
+        self._by_action: Dict[str, List[int]] = {}
+        self._by_actor: Dict[str, List[int]] = {}
+        self._by_ts: List[Tuple[str, int]] = []
+        self._by_parent: Dict[str, List[int]] = {}
+        self._token_ids: List[str] = []
+        self._actions: List[str] = []
+        self._actors: List[str] = []
+        self._timestamps: List[str] = []
+        self._parent_idx: List[int] = []
+        self._root = _ROOT_SEED
+
+    def _index_token(self, token: Token, idx: int) -> None:
+        self._index_row(
+            idx, token.token_id, token.action, token.actor, token.timestamp,
+            token.parent_id, token.content_hash
+        )
+
+    def _index_row(
+        self,
+        idx: int,
+        token_id: str,
+        action: str,
+        actor: str,
+        timestamp: str,
+        parent_id: Optional[str],
+        content_hash: str
+    ) -> None:
+        self._root = _extend_root(self._root, content_hash)
+        self._index[token_id] = idx
+        self._by_action.setdefault(action, []).append(idx)
+        self._by_actor.setdefault(actor, []).append(idx)
+        insort(self._by_ts, (timestamp, idx))
+        self._token_ids.append(token_id)
+        self._actions.append(action)
+        self._actors.append(actor)
+        self._timestamps.append(timestamp)
+        if parent_id:
+            self._parent_idx.append(self._index.get(parent_id, -1))
+            self._by_parent.setdefault(parent_id, []).append(idx)
+        else:
+            self._parent_idx.append(-1)
+        # Children stored before their parent (or before a newer token
+        # with the same id) now resolve to this position, like get() does
+        for child in self._by_parent.get(token_id, ()):
+            self._parent_idx[child] = idx
+
+    @abstractmethod
+    def _token_at(self, idx: int) -> Token:
+        """Token at a list position."""
+        pass
+
+    def chain_root(self) -> str:
+        return self._root.hex()
+
+    def walk_parents(self, token_id: str) -> Iterator[Token]:
+        idx = self._index.get(token_id) if token_id else None
+        if idx is None:
+            return
+        at = self._token_at
+        parents = self._parent_idx
+        seen = set()
+
+        while idx >= 0 and idx not in seen:
+            seen.add(idx)
+            yield at(idx)
+            idx = parents[idx]
+
+    def _find(
+        self,
+        action: Optional[str],
+        actor: Optional[str],
+        since: Optional[str],
+        limit: int
+    ) -> List[Token]:
+        """Filter via the smallest matching index instead of full scans."""
+        at = self._token_at
+        candidates = None
+        if action:
+            candidates = self._by_action.get(action, [])
+        if actor:
+            ids = self._by_actor.get(actor, [])
+            if candidates is None or len(ids) < len(candidates):
+                candidates = ids
+        if since:
+            pos = bisect_left(self._by_ts, (since,))
+            if candidates is None or len(self._by_ts) - pos < len(candidates):
+                candidates = sorted(i for _, i in self._by_ts[pos:])
+        if candidates is None:
+            return [at(i) for i in range(len(self._actions))[-limit:]]
+
+        actions, actors, stamps = self._actions, self._actors, self._timestamps
+
+        def match(i: int) -> bool:
+            return (
+                (not action or actions[i] == action)
+                and (not actor or actors[i] == actor)
+                and (not since or stamps[i] >= since)
+            )
+
+        if limit <= 0:
+            # Keep the [-limit:] slice semantics for non-positive limits
+            return [at(i) for i in candidates if match(i)][-limit:]
+
+        # Newest matches first, stop once the limit is reached
+        hits = []
+        for i in reversed(candidates):
+            if match(i):
+                hits.append(i)
+                if len(hits) == limit:
+                    break
+        return [at(i) for i in reversed(hits)]
+
+
+class MemoryStore(_IndexedStore):
     """
     In-memory token storage.
 
@@ -67,12 +418,15 @@ class MemoryStore(TokenStore):
 
     def __init__(self):
         self._tokens: List[Token] = []
-        self._index: dict[str, int] = {}
+        self._reset_indexes()
 
     def add(self, token: Token) -> None:
-        self._index[token.token_id] = len(self._tokens)
+        self._index_token(token, len(self._tokens))
         self._tokens.append(token)
 
+    def _token_at(self, idx: int) -> Token:
+        return self._tokens[idx]
+
     def get(self, token_id: str) -> Optional[Token]:
         idx = self._index.get(token_id)
         return self._tokens[idx] if idx is not None else None
@@ -87,82 +441,240 @@ class MemoryStore(TokenStore):
         since: Optional[str] = None,
         limit: int = 100
     ) -> List[Token]:
-        results = self._tokens
-
-        if action:
-            results = [t for t in results if t.action == action]
-        if actor:
-            results = [t for t in results if t.actor == actor]
-        if since:
-            results = [t for t in results if t.timestamp >= since]
+        return self._find(action, actor, since, limit)
 
-        return results[-limit:]
+    def children(self, parent_id: str) -> List[Token]:
+        return [self._tokens[i] for i in self._by_parent.get(parent_id, ())]
 
     def count(self) -> int:
         return len(self._tokens)
 
     def clear(self) -> None:
         self._tokens = []
-        self._index = {}
+        self._reset_indexes()
 
 
-class FileStore(TokenStore):
+class FileStore(_IndexedStore):
     """
     File-based token storage (JSONL).
 
     Append-only, persistent, audit-friendly.
     Thread-safe with fcntl file locking (Unix) or graceful fallback.
     Good for: production, compliance, long-term audit trails.
+
+    With lazy=True only the indexes and each line's byte offset are kept
+    for tokens already on disk; they are parsed again on each access.
+    Tokens added by this store stay in memory. Lazy mode assumes no other
+    process rotates or rewrites the file while it is open; a row that no
+    longer reads back as its indexed token raises ValueError, and
+    verify_file() reports it as corrupted.
+
+    The chain root of the file is kept in `<path>.root`, updated under the
+    same file lock as each append; stores sharing a file fold in each
+    other's lines first, so the record always covers the whole file.
+    verify_file() reports root_valid: True when the file matches the
+    record, False when it does not, and None without a record or when
+    lines follow that no writer recorded (appended by something else, or
+    by a crash between the two writes). Once not True, the record is left
+    as is, so the finding survives restarts. The sidecar sits next to the
+    file it vouches for; to guard against someone who can rewrite both,
+    also record chain_root() elsewhere. rotate() and clear() rewrite the
+    file and start a new root, so a root recorded before them no longer
+    verifies.
     """
 
-    def __init__(self, path: str):
+    def __init__(
+        self,
+        path: str,
+        flush_every: int = 1,
+        fsync: bool = False,
+        lazy: bool = False
+    ):
         """
         Initialize file store.
 
         Args:
             path: Path to JSONL file
+            flush_every: Write buffered tokens to the file every N adds
+                (1 = every add, the default). Pending tokens are also
+                written on flush(), close() and interpreter exit.
+            fsync: fsync the file after each write for durability
+            lazy: Index existing tokens without keeping them in memory
         """
         self.path = Path(path)
-        self._cache: List[Token] = []
-        self._index: dict[str, int] = {}
+        self.flush_every = max(1, flush_every)
+        self.fsync = fsync
+        self.lazy = lazy
+        self._reset_cache()
+        self._fh = None
+        self._reader = None
+        self._pending: List[bytes] = []
+        self._lock = threading.Lock()
+        self._closer = None
+        self._reader_closer = None
+        self._sidecar = _RootSidecar(self.path)
         self._load()
 
+    def _reset_cache(self) -> None:
+        # None entries are on-disk rows at _offsets/_lengths (lazy mode)
+        self._cache: List[Optional[Token]] = []
+        self._offsets = array("q")
+        self._lengths = array("q")
+        self._reset_indexes()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit — flush and close the file."""
+        self.close()
+        return False
+
     def _load(self):
-        """Load existing tokens from file."""
+        """Load existing tokens and check them against the recorded root."""
+        stored = self._sidecar.read()
+        matched = stored == self._root
+        end = 0
         if self.path.exists():
-            with open(self.path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        token = Token.from_json(line)
-                        self._index[token.token_id] = len(self._cache)
-                        self._cache.append(token)
-
-    def add(self, token: Token) -> None:
-        """Append token to file with exclusive lock."""
+            raw = self.path.read_bytes()
+            load = self._load_lazy if self.lazy else self._load_eager
+            matched = load(raw, stored) or matched
+            end = len(raw)
+        self._sidecar.start(self._root, end, stored, matched)
+
+    def _load_eager(self, raw: bytes, stored: Optional[bytes]) -> bool:
+        """Parse every line (hoisted lookups); True if stored is a prefix root."""
+        matched = False
+        lines = raw.decode("utf-8").split("\n")
+        cache: List[Optional[Token]] = [None] * len(lines)
+        loads = json.JSONDecoder().decode
+        token_cls = Token
+        state_cls = TokenState
+        index_token = self._index_token
+        n = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            data = loads(line)
+            state = data.get("state")
+            if isinstance(state, str):
+                data["state"] = state_cls(state)
+            token = token_cls(**data)
+            index_token(token, n)
+            if self._root == stored:
+                matched = True
+            cache[n] = token
+            n += 1
+        del cache[n:]
+        self._cache = cache
+        return matched
+
+    def _load_lazy(self, raw: bytes, stored: Optional[bytes]) -> bool:
+        """Index every line and remember where it is; True if stored is a prefix root."""
+        matched = False
+        loads = json.JSONDecoder().decode
+        index_row = self._index_row
+        cache, offsets, lengths = self._cache, self._offsets, self._lengths
+        offset = 0
+        for line in raw.split(b"\n"):
+            if line.strip():
+                data = loads(line.decode("utf-8"))
+                index_row(
+                    len(cache),
+                    _intern(data["token_id"]),
+                    _intern(data["action"]),
+                    _intern(data["actor"]),
+                    data["timestamp"],
+                    _intern(data.get("parent_id")),
+                    # Lines without a hash get one computed, as eager loads do
+                    data.get("content_hash") or Token.from_dict(data).content_hash,
+                )
+                if self._root == stored:
+                    matched = True
+                cache.append(None)
+                offsets.append(offset)
+                lengths.append(len(line))
+            offset += len(line) + 1
+        return matched
+
+    def _token_at(self, idx: int) -> Token:
+        token = self._cache[idx]
+        if token is None:
+            with self._lock:
+                if self._reader is None:
+                    # Unbuffered: rotate()/clear() rewrite the file in place
+                    self._reader = open(self.path, "rb", buffering=0)
+                    self._reader_closer = weakref.finalize(self, self._reader.close)
+                self._reader.seek(self._offsets[idx])
+                line = self._reader.read(self._lengths[idx])
+            token = Token.from_json(line.decode("utf-8"))
+            # A line rewritten with a different length shifts every later row
+            if token.token_id != self._token_ids[idx]:
+                raise ValueError(f"Token {self._token_ids[idx]} changed on disk")
+        return token
+
+    def _open(self) -> None:
+        """Open the long-lived append handle."""
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        line = token.to_json() + "\n"
+        self._fh = open(self.path, "ab")
+        self._closer = weakref.finalize(
+            self, _close_append_handle, self._fh, self._pending, self._lock,
+            self.fsync, self._sidecar
+        )
+
+    def _commit_root(self) -> None:
+        """Record the current root as the file's commitment (after a rewrite)."""
+        with self._lock:
+            if self._fh is None:
+                self._open()
+            with _file_lock(self._fh):
+                size = os.fstat(self._fh.fileno()).st_size
+                self._sidecar.reset(self._root, size, self.fsync)
 
-        with open(self.path, "a", encoding="utf-8") as f:
-            if _HAS_FCNTL:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    f.write(line)
-                    f.flush()
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-            else:
-                f.write(line)
+    def add(self, token: Token) -> None:
+        """Append token to file (buffered per flush_every) with exclusive lock."""
+        # Uncached: keeping every persisted line in memory would double RSS
+        line = token._serialize().encode() + b"\n"
+
+        with self._lock:
+            if self._fh is None:
+                self._open()
+            self._pending.append(line)
+            self._sidecar.pending.append(token.content_hash)
+            if len(self._pending) >= self.flush_every:
+                _write_lines(self._fh, self._pending, self.fsync, self._sidecar)
 
         # Update cache
-        self._index[token.token_id] = len(self._cache)
+        self._index_token(token, len(self._cache))
         self._cache.append(token)
 
+    def flush(self) -> None:
+        """Write any buffered tokens to the file."""
+        with self._lock:
+            if self._fh is not None:
+                _write_lines(self._fh, self._pending, self.fsync, self._sidecar)
+
+    def close(self) -> None:
+        """Flush buffered tokens and close the file handle."""
+        if self._closer is not None:
+            self._closer()
+        self._fh = None
+        self._closer = None
+        with self._lock:
+            if self._reader_closer is not None:
+                self._reader_closer()
+            self._reader = None
+            self._reader_closer = None
+
     def get(self, token_id: str) -> Optional[Token]:
         idx = self._index.get(token_id)
-        return self._cache[idx] if idx is not None else None
+        return self._token_at(idx) if idx is not None else None
 
     def all(self) -> List[Token]:
-        return list(self._cache)
+        if not self.lazy:
+            return list(self._cache)
+        return [self._token_at(i) for i in range(len(self._cache))]
 
     def find(
         self,
@@ -171,25 +683,21 @@ class FileStore(TokenStore):
         since: Optional[str] = None,
         limit: int = 100
     ) -> List[Token]:
-        results = self._cache
+        return self._find(action, actor, since, limit)
 
-        if action:
-            results = [t for t in results if t.action == action]
-        if actor:
-            results = [t for t in results if t.actor == actor]
-        if since:
-            results = [t for t in results if t.timestamp >= since]
-
-        return results[-limit:]
+    def children(self, parent_id: str) -> List[Token]:
+        return [self._token_at(i) for i in self._by_parent.get(parent_id, ())]
 
     def count(self) -> int:
         return len(self._cache)
 
     def clear(self) -> None:
         """Clear all tokens (rewrites file)."""
-        self._cache = []
-        self._index = {}
+        with self._lock:
+            self._pending.clear()
+        self._reset_cache()
         self.path.write_text("")
+        self._commit_root()
 
     def rotate(self, max_age_days: int = 30) -> int:
         """
@@ -207,6 +715,8 @@ class FileStore(TokenStore):
         if not self._cache:
             return 0
 
+        self.flush()
+
         cutoff = datetime.now().isoformat()
         # Calculate cutoff from max_age_days
         from datetime import timedelta
@@ -216,7 +726,7 @@ class FileStore(TokenStore):
         keep = []
         archive = []
 
-        for token in self._cache:
+        for token in self.all():
             if token.timestamp < cutoff:
                 archive.append(token)
             else:
@@ -234,13 +744,13 @@ class FileStore(TokenStore):
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
                 try:
                     for token in archive:
-                        f.write(token.to_json() + "\n")
+                        f.write(token._serialize() + "\n")
                     f.flush()
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
             else:
                 for token in archive:
-                    f.write(token.to_json() + "\n")
+                    f.write(token._serialize() + "\n")
 
         # Rewrite active file with only kept tokens
         with open(self.path, "w", encoding="utf-8") as f:
@@ -248,17 +758,25 @@ class FileStore(TokenStore):
                 fcntl.flock(f.fileno(), fcntl.LOCK_EX)
                 try:
                     for token in keep:
-                        f.write(token.to_json() + "\n")
+                        f.write(token._serialize() + "\n")
                     f.flush()
                 finally:
                     fcntl.flock(f.fileno(), fcntl.LOCK_UN)
             else:
                 for token in keep:
-                    f.write(token.to_json() + "\n")
+                    f.write(token._serialize() + "\n")
 
         # Update cache and index
-        self._cache = keep
-        self._index = {t.token_id: i for i, t in enumerate(keep)}
+        if self.lazy:
+            self._reset_cache()
+            self._load()
+        else:
+            self._cache = keep
+            self._reset_indexes()
+            for i, t in enumerate(keep):
+                self._index_token(t, i)
+        # The kept tokens start a new root; earlier recorded roots no longer apply
+        self._commit_root()
 
         return len(archive)
 
@@ -267,20 +785,28 @@ class FileStore(TokenStore):
         Verify all tokens in file.
 
         Returns:
-            Dict with valid/invalid counts and any corrupted IDs
+            Dict with valid/invalid counts, any corrupted IDs and whether
+            the file matches its recorded `<path>.root` (see class docs)
         """
         valid = 0
         invalid = []
 
-        for token in self._cache:
-            if token.verify():
+        for idx, token_id in enumerate(self._token_ids):
+            try:
+                ok = self._token_at(idx).verify()
+            except (ValueError, TypeError, KeyError):
+                # Lazy rows that no longer parse at their indexed offset
+                ok = False
+            if ok:
                 valid += 1
             else:
-                invalid.append(token.token_id)
+                invalid.append(token_id)
 
         return {
             "valid": valid,
             "invalid": len(invalid),
             "corrupted_ids": invalid,
-            "integrity": len(invalid) == 0
+            # None without a record, or with lines no writer recorded
+            "root_valid": self._sidecar.ok,
+            "integrity": len(invalid) == 0 and self._sidecar.ok is not False
         }
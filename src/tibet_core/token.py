@@ -8,10 +8,14 @@ Each token captures:
 - WHY it happened (erachter)
 """
 
+import base64
 import hashlib
 import hmac
 import json
-from dataclasses import dataclass, field, asdict
+import secrets
+import sys
+import time
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -30,8 +34,76 @@ class TokenState(Enum):
 MAX_FUTURE_SECONDS = 60
 
 
-@dataclass(frozen=True)
-class Token:
+def _sha256_hex(content: bytes, key: Optional[bytes]) -> str:
+    """SHA-256, or HMAC-SHA256 when a key is given."""
+    if key:
+        return hmac.new(key, content, hashlib.sha256).hexdigest()
+    return hashlib.sha256(content).hexdigest()
+
+
+def _blake2b_b64(content: bytes, key: Optional[bytes]) -> str:
+    """BLAKE2b-256 as unpadded base64url, keyed BLAKE2b when a key is given."""
+    if key and len(key) > 64:
+        key = hashlib.blake2b(key).digest()
+    digest = hashlib.blake2b(content, digest_size=32, key=key or b"").digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+# Content hash algorithms. SHA-256 is the SPEC §3 default and is stored as
+# a bare hex digest; any other algorithm is stored as "<algo>:<digest>" so
+# verify() can pick the right one per token. Tagged digests use unpadded
+# base64url (43 chars for 32 bytes instead of 64 hex chars).
+HASH_ALGO = "sha256"
+HASH_ALGORITHMS = {
+    "sha256": _sha256_hex,
+    "blake2b": _blake2b_b64,
+}
+
+# Encoders for hash content. Together equivalent to
+# json.dumps(..., sort_keys=True, default=str), without building a new
+# JSONEncoder per call: plain strings go straight to the C escaper,
+# everything else through one shared encoder.
+_encode = json.JSONEncoder(sort_keys=True, default=str).encode
+_encode_str = json.encoder.encode_basestring_ascii
+
+# Shared encoder for to_json(), same as json.dumps(..., default=str)
+_encode_json = json.JSONEncoder(default=str).encode
+
+
+def _enc(value: Any) -> str:
+    """JSON-encode one content field the way SPEC §3 does."""
+    if value.__class__ is str:
+        return _encode_str(value)
+    if value is None:
+        return "null"
+    if not value and value.__class__ in (list, dict):
+        return "[]" if value.__class__ is list else "{}"
+    return _encode(value)
+
+
+# Per-process salt for _key_id(): the verify cache never holds the key itself
+_KEY_SALT = secrets.token_bytes(16)
+
+
+def _key_id(key: Optional[bytes]) -> Optional[bytes]:
+    """Salted fingerprint of an HMAC key, safe to keep next to a token."""
+    if key is None:
+        return None
+    return hashlib.blake2b(key, key=_KEY_SALT, digest_size=16).digest()
+
+
+class _TokenCaches:
+    """
+    Per-process caches for Token, kept out of its dataclass fields.
+
+    Not being fields, they are left out of fields(), asdict(), equality
+    and Token.__reduce__, so pickles and copies never carry them.
+    """
+    __slots__ = ("_verified", "_json_cache")
+
+
+@dataclass(frozen=True, slots=True)
+class Token(_TokenCaches):
     """
     TIBET provenance token.
 
@@ -50,7 +122,8 @@ class Token:
 
         parent_id: Parent token for chain linking
         state: Current lifecycle state
-        content_hash: SHA-256 (or HMAC-SHA256) of token content
+        content_hash: SHA-256 (or HMAC-SHA256) of token content, or
+            "<algo>:<digest>" for a non-default algorithm
         signature: Optional cryptographic signature
     """
     token_id: str
@@ -73,63 +146,162 @@ class Token:
     signature: str = ""
 
     def __post_init__(self):
-        """Compute content hash if not set."""
+        """Intern identity strings and compute content hash if not set."""
+        # (_key_id(key), content_hash) of the last successful verify()
+        object.__setattr__(self, "_verified", None)
+        # (content_hash, JSON) memoized by to_json()
+        object.__setattr__(self, "_json_cache", None)
+        # Actions/actors repeat across tokens and parent_id repeats the
+        # parent's token_id; interning shares one string object for each.
+        # That already makes them fast dict keys (str caches its SipHash and
+        # equal interned strs compare by identity), so indexes key on the
+        # ids themselves rather than on a separate 64-bit fingerprint.
+        setattr_ = object.__setattr__
+        if self.action.__class__ is str:
+            setattr_(self, "action", sys.intern(self.action))
+        if self.actor.__class__ is str:
+            setattr_(self, "actor", sys.intern(self.actor))
+        if self.token_id.__class__ is str:
+            setattr_(self, "token_id", sys.intern(self.token_id))
+        if self.parent_id.__class__ is str:
+            setattr_(self, "parent_id", sys.intern(self.parent_id))
+
         if not self.content_hash:
             object.__setattr__(self, "content_hash", self._compute_hash())
 
+    def __reduce__(self):
+        """Pickle/copy as a constructor call over the fields; caches start empty."""
+        # Not __setstate__: Python 3.10 dataclasses replace it on frozen slots classes
+        return (self.__class__, tuple(getattr(self, f.name) for f in fields(self)))
+
     def _hash_content(self) -> bytes:
-        """Serialize token content for hashing."""
-        data = {
-            "token_id": self.token_id,
-            "action": self.action,
-            "timestamp": self.timestamp,
-            "actor": self.actor,
-            "erin": self.erin,
-            "eraan": self.eraan,
-            "eromheen": self.eromheen,
-            "erachter": self.erachter,
-            "parent_id": self.parent_id,
-            "state": self.state.value if isinstance(self.state, TokenState) else self.state,
-        }
-        return json.dumps(data, sort_keys=True, default=str).encode()
+        """
+        Serialize token content for hashing.
 
-    def _compute_hash(self, key: Optional[bytes] = None) -> str:
+        Produces the same bytes as json.dumps(data, sort_keys=True) over
+        the content fields (SPEC §3), but writes the keys in their sorted
+        order directly instead of building and sorting a dict.
+        """
+        state = self.state.value if isinstance(self.state, TokenState) else self.state
+        enc = _enc
+        return "".join((
+            '{"action": ', enc(self.action),
+            ', "actor": ', enc(self.actor),
+            ', "eraan": ', enc(self.eraan),
+            ', "erachter": ', enc(self.erachter),
+            ', "erin": ', enc(self.erin),
+            ', "eromheen": ', enc(self.eromheen),
+            ', "parent_id": ', enc(self.parent_id),
+            ', "state": ', enc(state),
+            ', "timestamp": ', enc(self.timestamp),
+            ', "token_id": ', enc(self.token_id),
+            "}",
+        )).encode()
+
+    def _digest(self, key: Optional[bytes], algo: str) -> str:
+        """Encoded digest of the token content with the given algorithm."""
+        return HASH_ALGORITHMS[algo](self._hash_content(), key)
+
+    def _compute_hash(self, key: Optional[bytes] = None, algo: str = HASH_ALGO) -> str:
         """
         Compute hash of token content.
 
         Args:
-            key: HMAC key. If provided, uses HMAC-SHA256.
-                 If None, uses plain SHA-256 (backward compatible).
+            key: HMAC key. If provided, uses HMAC-SHA256 (or keyed
+                 BLAKE2b). If None, uses the plain hash (backward compatible).
+            algo: Hash algorithm name from HASH_ALGORITHMS.
 
         Returns:
-            Hex digest string
+            Hex digest (SHA-256), or "<algo>:<base64url digest>"
         """
-        content = self._hash_content()
-        if key:
-            return hmac.new(key, content, hashlib.sha256).hexdigest()
-        return hashlib.sha256(content).hexdigest()
+        if algo not in HASH_ALGORITHMS:
+            raise ValueError(f"Unknown hash algorithm: {algo}")
+        digest = self._digest(key, algo)
+        return digest if algo == HASH_ALGO else f"{algo}:{digest}"
 
     def verify(self, key: Optional[bytes] = None) -> bool:
         """
         Verify token integrity by recomputing hash.
 
+        The algorithm is taken from the content_hash tag; untagged (and
+        "sha256:"-tagged) hashes are SHA-256.
+
+        A successful result is remembered for the same key and
+        content_hash, so repeated audits of the same token don't rehash.
+        Like the rest of the token, erin/eraan/eromheen are treated as
+        immutable once created.
+
         Args:
-            key: HMAC key used during creation. None for plain SHA-256.
+            key: HMAC key used during creation. None for a plain hash.
 
         Returns:
             True if hash matches
         """
-        return hmac.compare_digest(self.content_hash, self._compute_hash(key))
+        verified = self._verified
+        if verified is not None and verified[1] == self.content_hash and (
+            verified[0] is None if key is None else verified[0] == _key_id(key)
+        ):
+            return True
+
+        ok = self._matches(key)
+        # Only immutable keys are remembered; a bytearray could change under us
+        if ok and (key is None or key.__class__ is bytes):
+            object.__setattr__(self, "_verified", (_key_id(key), self.content_hash))
+        return ok
+
+    def _matches(self, key: Optional[bytes] = None) -> bool:
+        """Recompute the digest and compare, bypassing the verify() cache."""
+        algo, sep, digest = self.content_hash.partition(":")
+        if not sep:
+            algo, digest = HASH_ALGO, self.content_hash
+        if algo not in HASH_ALGORITHMS:
+            return False
+        return hmac.compare_digest(digest, self._digest(key, algo))
+
+    def _as_dict(self) -> Dict[str, Any]:
+        """Field dict that shares the token's containers (for serialization)."""
+        return {
+            "token_id": self.token_id,
+            "action": self.action,
+            "timestamp": self.timestamp,
+            "actor": self.actor,
+            "erin": self.erin,
+            "eraan": self.eraan,
+            "eromheen": self.eromheen,
+            "erachter": self.erachter,
+            "parent_id": self.parent_id,
+            "state": self.state.value if isinstance(self.state, TokenState) else self.state,
+            "content_hash": self.content_hash,
+            "signature": self.signature,
+        }
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        d = asdict(self)
-        d["state"] = self.state.value if isinstance(self.state, TokenState) else self.state
+        """Convert to dictionary (top-level containers are copies)."""
+        d = self._as_dict()
+        erin = self.erin
+        if isinstance(erin, (dict, list)):
+            d["erin"] = erin.copy()
+        d["eraan"] = list(self.eraan)
+        d["eromheen"] = dict(self.eromheen)
         return d
 
+    def _serialize(self) -> str:
+        """Serialize to JSON without touching the to_json() cache."""
+        return _encode_json(self._as_dict())
+
     def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        """
+        Convert to JSON string.
+
+        The result is memoized on the token (it is immutable once hashed),
+        so repeated exports don't re-serialize.
+        """
+        cached = self._json_cache
+        if cached is not None and cached[0] is self.content_hash:
+            return cached[1]
+        j = self._serialize()
+        object.__setattr__(self, "_json_cache", (self.content_hash, j))
+        return j
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Token":
@@ -148,10 +320,8 @@ class Token:
 
 
 def create_token_id(prefix: str = "tibet") -> str:
-    """Generate unique token ID."""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-    random_part = hashlib.sha256(f"{timestamp}{id(object())}".encode()).hexdigest()[:8]
-    return f"{prefix}_{timestamp}_{random_part}"
+    """Generate unique token ID: prefix, epoch nanoseconds, 32 random bits."""
+    return f"{prefix}_{time.time_ns():020d}_{secrets.token_hex(4)}"
 
 
 def validate_timestamp(ts: str) -> bool:
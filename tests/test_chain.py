@@ -5,6 +5,7 @@ from datetime import datetime
 import pytest
 
 from tibet_core import Chain, Provider, MemoryStore, Token
+from tibet_core.store import TokenStore
 from tibet_core.token import create_token_id
 
 
@@ -46,6 +47,17 @@ class TestTrace:
         result = chain.trace(tokens[-1].token_id, max_depth=5)
         assert len(result) == 5
 
+    def test_trace_custom_store(self):
+        """Stores without parent pointers fall back to get() per hop."""
+        class ListStore(MemoryStore):
+            walk_parents = TokenStore.walk_parents
+
+        p = Provider(actor="jis:test", store=ListStore())
+        tokens = [p.create(f"action_{i}") for i in range(4)]
+        chain = Chain(p.store)
+        assert chain.trace(tokens[-1].token_id) == tokens[::-1]
+        assert chain.trace(tokens[-1].token_id, max_depth=2) == tokens[:1:-1]
+
 
 class TestVerify:
     def test_verify_valid_chain(self):
@@ -53,6 +65,37 @@ class TestVerify:
         chain = Chain(p.store)
         assert chain.verify(tokens[-1].token_id) is True
 
+    def test_verify_detects_tamper(self):
+        p, tokens = _build_chain(3)
+        object.__setattr__(tokens[1], "content_hash", "0" * 64)
+        chain = Chain(p.store)
+        assert chain.verify(tokens[-1].token_id) is False
+        assert chain.summary(tokens[-1].token_id)["valid"] is False
+
+    def test_verify_against_root(self):
+        p, tokens = _build_chain(3)
+        root = p.chain_root
+        chain = Chain(p.store)
+        assert chain.verify_against_root(root) is True
+        assert chain.verify_against_root(MemoryStore().chain_root()) is False
+
+    def test_verify_against_root_detects_rehashed_tamper(self):
+        """A token edited and re-hashed still verifies alone, but not against the root."""
+        p, tokens = _build_chain(3)
+        root = p.chain_root
+        object.__setattr__(tokens[1], "erachter", "rewritten")
+        object.__setattr__(tokens[1], "content_hash", tokens[1]._compute_hash())
+        chain = Chain(p.store)
+        assert chain.verify(tokens[-1].token_id) is True
+        assert chain.verify_against_root(root) is False
+
+    def test_verify_against_root_ignores_verify_cache(self):
+        p, tokens = _build_chain(3)
+        root = p.chain_root
+        assert all(p.verify_all().values())
+        object.__setattr__(tokens[1], "erachter", "tampered")
+        assert Chain(p.store).verify_against_root(root) is False
+
     def test_verify_empty(self):
         store = MemoryStore()
         chain = Chain(store)
@@ -68,6 +111,10 @@ class TestSummary:
         assert s["valid"] is True
         assert "jis:test" in s["actors"]
         assert len(s["actions"]) == 3
+        assert s["actions"] == ["action_2", "action_1", "action_0"]
+        assert s["root_id"] == tokens[0].token_id
+        assert s["start"] == tokens[0].timestamp
+        assert s["end"] == tokens[-1].timestamp
 
     def test_summary_empty(self):
         store = MemoryStore()
@@ -105,6 +152,16 @@ class TestFindChildren:
         assert c1.token_id in ids
         assert c2.token_id in ids
 
+    def test_find_children_custom_store(self):
+        """Stores without a children index fall back to scanning all()."""
+        class ListStore(MemoryStore):
+            children = TokenStore.children
+
+        p = Provider(actor="jis:test", store=ListStore(), auto_chain=False)
+        parent = p.create("parent")
+        child = p.create("child", parent_id=parent.token_id)
+        assert Chain(p.store).find_children(parent.token_id) == [child]
+
 
 class TestTree:
     def test_tree(self):
@@ -118,6 +175,33 @@ class TestTree:
         assert len(tree["children"]) == 1
         assert tree["children"][0]["action"] == "child"
 
+    def test_tree_sibling_order_and_truncation(self):
+        p = Provider(actor="jis:test", auto_chain=False)
+        root = p.create("root")
+        a = p.create("a", parent_id=root.token_id)
+        p.create("b", parent_id=root.token_id)
+        p.create("a1", parent_id=a.token_id)
+
+        tree = Chain(p.store).tree(root.token_id, max_depth=1)
+        assert [c["action"] for c in tree["children"]] == ["a", "b"]
+        assert tree["children"][0]["children"][0]["truncated"] is True
+        assert tree["children"][1]["children"] == []
+
+    def test_tree_missing_root(self):
+        tree = Chain(MemoryStore()).tree("nope")
+        assert tree == {"id": "nope", "missing": True}
+
+    def test_tree_deep_chain(self):
+        """Deep trees must not hit the recursion limit."""
+        p, tokens = _build_chain(1500)
+        tree = Chain(p.store).tree(tokens[0].token_id, max_depth=2000)
+        depth = 0
+        while tree["children"]:
+            tree = tree["children"][0]
+            depth += 1
+        assert depth == 1499
+        assert tree["id"] == tokens[-1].token_id
+
     def test_circular_protection(self):
         """Trace should handle circular references gracefully."""
         store = MemoryStore()
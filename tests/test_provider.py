@@ -40,6 +40,16 @@ class TestProviderBasic:
         t = p.create("action", actor="jis:override")
         assert t.actor == "jis:override"
 
+    def test_chain_root(self):
+        p = Provider(actor="jis:test")
+        roots = {p.chain_root}
+        p.create("a")
+        roots.add(p.chain_root)
+        p.create("b")
+        roots.add(p.chain_root)
+        assert len(roots) == 3
+        assert all(len(r) == 64 for r in roots)
+
     def test_count(self):
         p = Provider(actor="jis:test")
         assert p.count == 0
@@ -124,6 +134,25 @@ class TestHMACProvider:
         assert all(results.values())
 
 
+class TestHashAlgoProvider:
+    def test_blake2b_tokens(self):
+        p = Provider(actor="jis:test", hash_algo="blake2b")
+        t = p.create("fast_action")
+        assert t.content_hash.startswith("blake2b:")
+        assert t.verify() is True
+
+    def test_blake2b_hmac_verify_all(self):
+        key = b"test_key"
+        p = Provider(actor="jis:test", hmac_key=key, hash_algo="blake2b")
+        p.create("a")
+        p.create("b")
+        assert all(p.verify_all().values())
+
+    def test_unknown_algo(self):
+        with pytest.raises(ValueError):
+            Provider(actor="jis:test", hash_algo="md5")
+
+
 class TestCallback:
     def test_on_token_callback(self):
         received = []
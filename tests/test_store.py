@@ -1,7 +1,9 @@
 """Tests for tibet_core.store — MemoryStore and FileStore."""
 
+import gc
 import json
 import os
+import random
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -9,6 +11,7 @@ from pathlib import Path
 import pytest
 
 from tibet_core import Token, MemoryStore, FileStore
+from tibet_core.store import TokenStore
 from tibet_core.token import create_token_id
 
 
@@ -75,6 +78,83 @@ class TestMemoryStore:
             store.add(_make_token())
         assert len(store.find(limit=3)) == 3
 
+    def test_children(self):
+        store = MemoryStore()
+        parent = _make_token()
+        c1 = _make_token(parent_id=parent.token_id)
+        store.add(parent)
+        store.add(c1)
+        store.add(_make_token())
+        c2 = _make_token(parent_id=parent.token_id)
+        store.add(c2)
+        assert store.children(parent.token_id) == [c1, c2]
+        assert store.children("nope") == []
+        store.clear()
+        assert store.children(parent.token_id) == []
+
+    def test_find_since(self):
+        store = MemoryStore()
+        store.add(_make_token(timestamp="2026-01-01T00:00:00"))
+        store.add(_make_token(timestamp="2026-03-01T00:00:00"))
+        store.add(_make_token(timestamp="2026-02-01T00:00:00"))
+        found = store.find(since="2026-02-01")
+        assert [t.timestamp[:7] for t in found] == ["2026-03", "2026-02"]
+
+    def test_find_limit_keeps_newest(self):
+        store = MemoryStore()
+        tokens = [_make_token(action="login") for _ in range(5)]
+        for t in tokens:
+            store.add(t)
+        assert store.find(action="login", limit=2) == tokens[-2:]
+
+    def test_walk_parents(self):
+        store = MemoryStore()
+        root = _make_token()
+        child = _make_token(parent_id=root.token_id)
+        grandchild = _make_token(parent_id=child.token_id)
+        # Out of order: pointers are patched once the parent arrives
+        store.add(grandchild)
+        store.add(root)
+        store.add(child)
+        assert list(store.walk_parents(grandchild.token_id)) == [grandchild, child, root]
+        assert list(store.walk_parents("nope")) == []
+
+    def test_walk_parents_follows_latest_duplicate(self):
+        store = MemoryStore()
+        old = _make_token(token_id="dup", action="old")
+        child = _make_token(parent_id="dup")
+        store.add(old)
+        store.add(child)
+        new = _make_token(token_id="dup", action="new")
+        store.add(new)
+        assert list(store.walk_parents(child.token_id)) == [child, new]
+
+    def test_find_matches_linear_scan(self):
+        """Indexed find() must return exactly what a linear filter would."""
+        rng = random.Random(42)
+        store = MemoryStore()
+        tokens = []
+        for _ in range(300):
+            t = _make_token(
+                action=rng.choice(["login", "logout", "search"]),
+                actor=rng.choice(["alice", "bob", "carol"]),
+                timestamp=f"2026-01-{rng.randint(1, 28):02d}",
+            )
+            store.add(t)
+            tokens.append(t)
+
+        for action in (None, "login", "nope"):
+            for actor in (None, "bob"):
+                for since in (None, "2026-01-15", "2027"):
+                    for limit in (100, 3, 0):
+                        expected = [
+                            t for t in tokens
+                            if (not action or t.action == action)
+                            and (not actor or t.actor == actor)
+                            and (not since or t.timestamp >= since)
+                        ][-limit:]
+                        assert store.find(action, actor, since, limit) == expected
+
 
 class TestFileStore:
     def test_add_and_get(self, tmp_path):
@@ -97,6 +177,19 @@ class TestFileStore:
         assert store2.count() == 1
         assert store2.get(t.token_id).token_id == t.token_id
 
+    def test_load_skips_blank_lines(self, tmp_path):
+        path = tmp_path / "tokens.jsonl"
+        t1 = _make_token(erin="日本語")
+        t2 = _make_token(state="detected")
+        path.write_bytes(
+            (t1.to_json() + "\r\n\n" + t2.to_json() + "\n\n").encode()
+        )
+        store = FileStore(str(path))
+        assert store.count() == 2
+        assert store.get(t1.token_id).erin == "日本語"
+        assert store.get(t2.token_id).state.value == "detected"
+        assert store.verify_file()["integrity"] is True
+
     def test_file_created(self, tmp_path):
         path = tmp_path / "sub" / "tokens.jsonl"
         store = FileStore(str(path))
@@ -130,6 +223,178 @@ class TestFileStore:
         store.add(_make_token(action="login"))
         assert len(store.find(action="login")) == 2
 
+    def test_find_after_reload(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        store = FileStore(path)
+        store.add(_make_token(action="login", actor="alice"))
+        store.add(_make_token(action="login", actor="bob"))
+        store.add(_make_token(action="logout", actor="alice"))
+
+        store2 = FileStore(path)
+        assert len(store2.find(action="login")) == 2
+        assert len(store2.find(action="login", actor="alice")) == 1
+
+    def test_append_handle_reused(self, tmp_path):
+        store = FileStore(str(tmp_path / "tokens.jsonl"))
+        store.add(_make_token())
+        fh = store._fh
+        store.add(_make_token())
+        assert store._fh is fh
+        assert len(Path(store.path).read_text().splitlines()) == 2
+
+    def test_flush_every_batches_writes(self, tmp_path):
+        path = tmp_path / "tokens.jsonl"
+        store = FileStore(str(path), flush_every=3)
+        store.add(_make_token())
+        store.add(_make_token())
+        assert path.read_text() == ""
+        assert store.count() == 2  # buffered tokens are still readable
+        store.add(_make_token())
+        assert len(path.read_text().splitlines()) == 3
+
+    def test_close_flushes_pending(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        with FileStore(path, flush_every=100, fsync=True) as store:
+            store.add(_make_token())
+            store.add(_make_token())
+        assert FileStore(path).count() == 2
+
+    def test_add_after_close_reopens(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        store = FileStore(path)
+        store.add(_make_token())
+        store.close()
+        store.add(_make_token())
+        assert FileStore(path).count() == 2
+
+    def test_clear_drops_pending(self, tmp_path):
+        path = tmp_path / "tokens.jsonl"
+        store = FileStore(str(path), flush_every=10)
+        store.add(_make_token())
+        store.clear()
+        store.close()
+        assert path.read_text() == ""
+
+    def test_children_after_reload(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        store = FileStore(path)
+        parent = _make_token()
+        child = _make_token(parent_id=parent.token_id)
+        store.add(parent)
+        store.add(child)
+        children = FileStore(path).children(parent.token_id)
+        assert [c.token_id for c in children] == [child.token_id]
+
+    def test_chain_root_survives_reload(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        store = FileStore(path)
+        empty_root = store.chain_root()
+        for _ in range(3):
+            store.add(_make_token())
+        root = store.chain_root()
+        assert root != empty_root
+        assert root == TokenStore.chain_root(store)
+        store.close()
+        assert FileStore(path).chain_root() == root
+        assert FileStore(path, lazy=True).chain_root() == root
+
+        store.clear()
+        assert store.chain_root() == empty_root
+
+    def test_root_sidecar(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        store = FileStore(path, flush_every=2)
+        for _ in range(3):
+            store.add(_make_token())
+        store.close()
+        assert Path(path + ".root").read_text() == store.chain_root()
+        for lazy in (False, True):
+            assert FileStore(path, lazy=lazy).verify_file()["root_valid"] is True
+
+    def test_root_sidecar_detects_rehashed_edit(self, tmp_path):
+        path = tmp_path / "tokens.jsonl"
+        store = FileStore(str(path))
+        store.add(_make_token(erin="x"))
+        store.add(_make_token())
+        store.close()
+
+        # Edit and re-hash a line while no store has the file open
+        first, rest = path.read_text().split("\n", 1)
+        data = json.loads(first)
+        data.update(erin="y", content_hash="")
+        path.write_text(Token.from_dict(data).to_json() + "\n" + rest)
+
+        for lazy in (False, True):
+            result = FileStore(str(path), lazy=lazy).verify_file()
+            assert result["corrupted_ids"] == []
+            assert result["root_valid"] is False
+            assert result["integrity"] is False
+
+        # Appending does not overwrite the recorded root
+        store = FileStore(str(path))
+        store.add(_make_token())
+        store.close()
+        assert FileStore(str(path)).verify_file()["root_valid"] is False
+
+    def test_root_sidecar_flags_unrecorded_tail(self, tmp_path):
+        """Lines appended behind the stores' back are reported, not absorbed."""
+        path = tmp_path / "tokens.jsonl"
+        store = FileStore(str(path))
+        store.add(_make_token())
+        store.close()
+        with open(path, "a") as f:
+            f.write(_make_token().to_json() + "\n")
+        result = FileStore(str(path)).verify_file()
+        assert result["root_valid"] is None
+
+        # Neither a later store's appends nor a reload fold them in
+        store = FileStore(str(path))
+        store.add(_make_token())
+        store.close()
+        assert FileStore(str(path)).verify_file()["root_valid"] is None
+
+    def test_root_sidecar_flags_tail_appended_while_open(self, tmp_path):
+        path = tmp_path / "tokens.jsonl"
+        store = FileStore(str(path))
+        store.add(_make_token())
+        with open(path, "a") as f:
+            f.write(_make_token().to_json() + "\n")
+        store.add(_make_token())
+        assert store.verify_file()["root_valid"] is None
+        store.close()
+        assert FileStore(str(path)).verify_file()["root_valid"] is None
+
+    def test_root_sidecar_two_writers(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        a = FileStore(path)
+        b = FileStore(path, flush_every=2)
+        a.add(_make_token())
+        b.add(_make_token())
+        a.add(_make_token())
+        b.add(_make_token())
+        a.add(_make_token())
+        a.close()
+        b.close()
+        result = FileStore(path).verify_file()
+        assert result["valid"] == 5
+        assert result["root_valid"] is True
+        assert result["integrity"] is True
+
+    def test_rotate_and_clear_start_new_root(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        store = FileStore(path)
+        store.add(_make_token(timestamp=(datetime.now() - timedelta(days=60)).isoformat()))
+        store.add(_make_token())
+        before = store.chain_root()
+        assert store.rotate(max_age_days=30) == 1
+        assert store.chain_root() != before
+        store.close()
+        assert FileStore(path).verify_file()["root_valid"] is True
+
+        store.clear()
+        store.close()
+        assert FileStore(path).verify_file()["root_valid"] is True
+
     def test_rotate_empty(self, tmp_path):
         path = str(tmp_path / "tokens.jsonl")
         store = FileStore(path)
@@ -153,6 +418,7 @@ class TestFileStore:
         assert store.count() == 1
         assert store.get(recent_token.token_id) is not None
         assert store.get(old_token.token_id) is None
+        assert store.find() == [store.get(recent_token.token_id)]
 
         # Check archive file exists
         archives = list(tmp_path.glob("*.archive.*.jsonl"))
@@ -165,3 +431,94 @@ class TestFileStore:
         store.add(_make_token())
         assert store.rotate(max_age_days=30) == 0
         assert store.count() == 2
+
+
+class TestLazyFileStore:
+    def _populate(self, path):
+        store = FileStore(path)
+        root = _make_token(action="login", actor="alice")
+        store.add(root)
+        child = _make_token(action="search", actor="alice", parent_id=root.token_id, erin={"q": "x"})
+        store.add(child)
+        store.add(_make_token(action="login", actor="bob"))
+        store.close()
+        return root, child
+
+    def test_index_only_until_accessed(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        root, child = self._populate(path)
+        store = FileStore(path, lazy=True)
+        assert store.count() == 3
+        assert store._cache == [None, None, None]
+
+        got = store.get(child.token_id)
+        assert got == child
+        assert got.verify()
+        assert store.get("nope") is None
+
+    def test_reader_closed_with_store(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        root, child = self._populate(path)
+        store = FileStore(path, lazy=True)
+        store.get(child.token_id)
+        reader = store._reader
+        del store
+        gc.collect()
+        assert reader.closed
+
+    def test_queries(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        root, child = self._populate(path)
+        store = FileStore(path, lazy=True)
+        assert [t.actor for t in store.find(action="login")] == ["alice", "bob"]
+        assert store.children(root.token_id) == [child]
+        assert list(store.walk_parents(child.token_id)) == [child, root]
+        assert len(store.all()) == 3
+        assert store.verify_file()["integrity"] is True
+
+    def test_add_after_lazy_load(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        self._populate(path)
+        store = FileStore(path, lazy=True)
+        t = _make_token(action="logout")
+        store.add(t)
+        assert store.get(t.token_id) is t
+        assert store.count() == 4
+        assert FileStore(path, lazy=True).get(t.token_id) == t
+
+    def test_reads_current_file_contents(self, tmp_path):
+        """Lazy reads come from disk, so on-disk tampering shows up in verify."""
+        path = tmp_path / "tokens.jsonl"
+        root, child = self._populate(str(path))
+        store = FileStore(str(path), lazy=True)
+        path.write_text(path.read_text().replace('"erin": {"q": "x"}', '"erin": {"q": "y"}'))
+        assert store.get(child.token_id).verify() is False
+        assert store.verify_file()["corrupted_ids"] == [child.token_id]
+
+    def test_line_length_change_reported(self, tmp_path):
+        """A longer line shifts later offsets; those rows are reported, not raised."""
+        path = tmp_path / "tokens.jsonl"
+        root, child = self._populate(str(path))
+        store = FileStore(str(path), lazy=True)
+        last = store.find(actor="bob")[0]
+        path.write_text(path.read_text().replace('"erin": {"q": "x"}', '"erin": {"q": "xy"}'))
+        assert store.get(root.token_id) == root
+        with pytest.raises(ValueError):
+            store.get(child.token_id)
+        assert store.verify_file()["corrupted_ids"] == [child.token_id, last.token_id]
+
+    def test_rotate(self, tmp_path):
+        path = str(tmp_path / "tokens.jsonl")
+        store = FileStore(path)
+        old = _make_token(timestamp=(datetime.now() - timedelta(days=60)).isoformat())
+        recent = _make_token()
+        store.add(old)
+        store.add(recent)
+        store.close()
+
+        lazy = FileStore(path, lazy=True)
+        assert lazy.rotate(max_age_days=30) == 1
+        assert lazy.chain_root() == TokenStore.chain_root(lazy)
+        assert lazy.count() == 1
+        assert lazy.get(old.token_id) is None
+        assert lazy.get(recent.token_id) == recent
@@ -1,13 +1,15 @@
 """Tests for tibet_core.token — frozen Token with HMAC."""
 
+import copy
 import json
+import pickle
 import time
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, asdict, fields
 from datetime import datetime, timedelta
 
 import pytest
 
-from tibet_core.token import Token, TokenState, create_token_id, validate_timestamp, MAX_FUTURE_SECONDS
+from tibet_core.token import Token, TokenState, create_token_id, validate_timestamp, MAX_FUTURE_SECONDS, HASH_ALGORITHMS
 
 
 def _make_token(**kwargs):
@@ -47,6 +49,16 @@ class TestTokenCreation:
         assert t.eromheen == {"env": "test"}
         assert t.erachter == "Because testing"
 
+    def test_identity_strings_interned(self):
+        parent = _make_token(token_id="".join(["tok", "_parent"]))
+        t1 = Token.from_json(_make_token(
+            action="".join(["log", "in"]), parent_id="".join(["tok", "_parent"])
+        ).to_json())
+        t2 = Token.from_json(_make_token(action="".join(["log", "in"])).to_json())
+        assert t1.action is t2.action
+        assert t1.actor is t2.actor
+        assert t1.parent_id is parent.token_id
+
     def test_defaults(self):
         t = _make_token()
         assert t.erin is None
@@ -73,6 +85,46 @@ class TestFrozen:
         with pytest.raises(FrozenInstanceError):
             t.content_hash = "fake"
 
+    def test_slots_no_dict(self):
+        t = _make_token()
+        assert not hasattr(t, "__dict__")
+
+    def test_pickle_roundtrip(self):
+        t = _make_token(erin={"k": [1, 2]})
+        t2 = pickle.loads(pickle.dumps(t))
+        assert t2 == t
+        assert t2.verify()
+
+    def test_pickle_keeps_no_key(self):
+        key = b"SUPER-SECRET-HMAC-KEY"
+        t = _make_token()
+        object.__setattr__(t, "content_hash", t._compute_hash(key))
+        assert t.verify(key) is True
+        t.to_json()
+        data = pickle.dumps(t)
+        assert key not in data
+        t2 = pickle.loads(data)
+        assert t2._verified is None and t2._json_cache is None
+        assert t2.verify(key) is True
+
+    def test_copy_resets_caches(self):
+        t = _make_token()
+        assert t.verify() is True
+        t.to_json()
+        for t2 in (copy.copy(t), copy.deepcopy(t)):
+            assert t2 == t
+            assert t2._verified is None and t2._json_cache is None
+            assert t2.verify() is True
+            assert t2.to_json() == t.to_json()
+
+    def test_caches_are_not_fields(self):
+        key = b"SUPER-SECRET-HMAC-KEY"
+        t = _make_token()
+        object.__setattr__(t, "content_hash", t._compute_hash(key))
+        assert t.verify(key) is True
+        assert not any(f.name.startswith("_") for f in fields(t))
+        assert key not in repr(asdict(t)).encode()
+
 
 class TestHashing:
     def test_verify_sha256(self):
@@ -109,6 +161,50 @@ class TestHashing:
         assert t.verify() is False  # Without key = mismatch
         assert t.verify(b"wrong_key") is False
 
+    def test_verify_cached(self, monkeypatch):
+        t = _make_token()
+        assert t.verify() is True
+        monkeypatch.setattr(Token, "_digest", lambda *a: pytest.fail("rehashed"))
+        assert t.verify() is True
+
+    def test_verify_cache_per_key(self):
+        key = b"my_secret"
+        t = _make_token()
+        object.__setattr__(t, "content_hash", t._compute_hash(key))
+        assert t.verify(key) is True
+        assert t.verify(key) is True
+        assert t.verify() is False
+        assert t.verify(b"wrong_key") is False
+
+    def test_verify_cache_follows_hash(self):
+        t = _make_token()
+        assert t.verify() is True
+        object.__setattr__(t, "content_hash", "0" * 64)
+        assert t.verify() is False
+
+    def test_hash_content_matches_spec(self):
+        """Canonical bytes must equal the SPEC §3 json.dumps form."""
+        t = _make_token(
+            erin={"b": [1, 2.5, None], "a": "ü"},
+            eraan=["ref"],
+            eromheen={"when": datetime(2026, 1, 1)},
+            erachter="Because \"testing\"",
+            parent_id="parent_001",
+        )
+        data = {
+            "token_id": t.token_id,
+            "action": t.action,
+            "timestamp": t.timestamp,
+            "actor": t.actor,
+            "erin": t.erin,
+            "eraan": t.eraan,
+            "eromheen": t.eromheen,
+            "erachter": t.erachter,
+            "parent_id": t.parent_id,
+            "state": t.state.value,
+        }
+        assert t._hash_content() == json.dumps(data, sort_keys=True, default=str).encode()
+
     def test_deterministic_hash(self):
         ts = "2026-01-01T00:00:00"
         t1 = Token(token_id="a", action="x", timestamp=ts, actor="y")
@@ -116,6 +212,43 @@ class TestHashing:
         assert t1.content_hash == t2.content_hash
 
 
+class TestHashAlgorithms:
+    def test_blake2b_tagged(self):
+        t = _make_token()
+        h = t._compute_hash(algo="blake2b")
+        assert h.startswith("blake2b:")
+        assert len(h.split(":", 1)[1]) == 43  # unpadded base64url of 32 bytes
+
+    def test_blake2b_verify(self):
+        t = _make_token()
+        object.__setattr__(t, "content_hash", t._compute_hash(algo="blake2b"))
+        assert t.verify() is True
+
+    def test_blake2b_keyed(self):
+        key = b"k" * 100  # longer than BLAKE2b's 64-byte key limit
+        t = _make_token()
+        object.__setattr__(t, "content_hash", t._compute_hash(key, "blake2b"))
+        assert t.verify(key) is True
+        assert t.verify() is False
+
+    def test_sha256_tag_accepted(self):
+        t = _make_token()
+        object.__setattr__(t, "content_hash", "sha256:" + t.content_hash)
+        assert t.verify() is True
+
+    def test_unknown_algo(self):
+        t = _make_token()
+        with pytest.raises(ValueError):
+            t._compute_hash(algo="md5")
+        object.__setattr__(t, "content_hash", "md5:" + "0" * 32)
+        assert t.verify() is False
+
+    def test_default_is_sha256(self):
+        assert set(HASH_ALGORITHMS) >= {"sha256", "blake2b"}
+        t = _make_token()
+        assert ":" not in t.content_hash
+
+
 class TestSerialization:
     def test_to_dict(self):
         t = _make_token(erin="hello")
@@ -124,6 +257,23 @@ class TestSerialization:
         assert d["state"] == "created"
         assert isinstance(d, dict)
 
+    def test_to_dict_fields(self):
+        t = _make_token(parent_id="p1")
+        assert list(t.to_dict()) == [
+            "token_id", "action", "timestamp", "actor",
+            "erin", "eraan", "eromheen", "erachter",
+            "parent_id", "state", "content_hash", "signature",
+        ]
+
+    def test_to_dict_copies_containers(self):
+        t = _make_token(erin={"k": 1}, eraan=["a"], eromheen={"env": "x"})
+        d = t.to_dict()
+        d["erin"]["k"] = 2
+        d["eraan"].append("b")
+        d["eromheen"]["env"] = "y"
+        assert t.verify()
+        assert t.erin == {"k": 1}
+
     def test_to_json_roundtrip(self):
         t = _make_token(erin={"key": "value"}, eraan=["a", "b"])
         j = t.to_json()
@@ -133,6 +283,23 @@ class TestSerialization:
         assert t2.eraan == t.eraan
         assert t2.content_hash == t.content_hash
 
+    def test_to_json_matches_json_dumps(self):
+        t = _make_token(erin={"when": datetime(2026, 1, 1), "n": float("nan")}, erachter="ü")
+        assert t.to_json() == json.dumps(t.to_dict(), default=str)
+
+    def test_to_json_memoized(self, monkeypatch):
+        t = _make_token(erin={"key": "value"})
+        j = t.to_json()
+        monkeypatch.setattr(Token, "_serialize", lambda self: pytest.fail("re-serialized"))
+        assert t.to_json() is j
+        assert "_json_cache" not in t.to_dict()
+
+    def test_to_json_follows_hash(self):
+        t = _make_token()
+        t.to_json()
+        object.__setattr__(t, "content_hash", "f" * 64)
+        assert json.loads(t.to_json())["content_hash"] == "f" * 64
+
     def test_from_dict_state_string(self):
         d = {
             "token_id": "t1",
@@ -165,11 +332,18 @@ class TestTokenId:
         assert tid.startswith("tibet_")
         parts = tid.split("_")
         assert len(parts) == 3
+        assert len(parts[1]) == 20 and parts[1].isdigit()
+        assert len(parts[2]) == 8
 
     def test_create_token_id_unique(self):
         ids = {create_token_id() for _ in range(100)}
         assert len(ids) == 100
 
+    def test_create_token_id_sortable(self):
+        first = create_token_id()
+        time.sleep(0.001)
+        assert create_token_id() > first
+
     def test_create_token_id_custom_prefix(self):
         tid = create_token_id(prefix="custom")
         assert tid.startswith("custom_")